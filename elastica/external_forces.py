@@ -1,6 +1,7 @@
 __doc__ = """ Module for boundary condition implementations that apply external forces to the rod. """
 
 import numpy as np
+import numba
 from elastica._linalg import _batch_matvec
 from elastica._spline import _bspline
 
@@ -266,6 +267,13 @@ class MuscleTorques(NoForces):
         assert ramp_up_time >= 0.0
         self.ramp_up_time = ramp_up_time
 
+        # Spatial quantities depend only on the rod's rest configuration and
+        # are cached on the first `apply_torques` call (the rod is not known
+        # here). See `_compute_spatial_arrays`.
+        self.spline_values = None
+        self.wave_number_times_s = None
+        self.torque_mag = None
+
         if with_spline:
             assert b_coeff.size != 0, "Beta spline coefficient array (t_coeff) is empty"
             self.my_spline, ctr_pts, ctr_coeffs = _bspline(b_coeff, base_length)
@@ -289,10 +297,24 @@ class MuscleTorques(NoForces):
 
             self.my_spline = constant_function
 
-    def apply_torques(self, system, time: np.float = 0.0):
+    def _compute_spatial_arrays(self, system):
+        """
+        Caches every spatial quantity of the traveling wave, which depends
+        only on the rest configuration of the rod.
 
-        # Ramp up the muscle torque
-        factor = min(1.0, time / self.ramp_up_time)
+        The spline (a scipy evaluation) and the wave-number scaled arc
+        length were previously recomputed on every substep of every
+        timestep; both are constant in time, so evaluate them once here.
+
+        Parameters
+        ----------
+        system : object
+            System that is Rod-like.
+
+        Returns
+        -------
+
+        """
         # From the node 1 to node nelem-1
         # s is the position of nodes on the rod, we go from node=1 to node=nelem-1, because there is no
         # torques applied by first and last node on elements. Reason is that we cannot apply torque in an
@@ -301,23 +323,82 @@ class MuscleTorques(NoForces):
         # torque. This coupled with the requirement that the sum of all muscle torques has
         # to be zero results in this condition.
         s = np.cumsum(system.rest_lengths)
+        self.spline_values = np.ascontiguousarray(self.my_spline(s))
+        self.wave_number_times_s = self.wave_number * s
+        # Scratch buffer reused across calls for the wave evaluation
+        self.torque_mag = np.empty_like(s)
+
+    def apply_torques(self, system, time: np.float = 0.0):
+
+        # Ramp up the muscle torque
+        factor = min(1.0, time / self.ramp_up_time)
+        if self.spline_values is None:
+            self._compute_spatial_arrays(system)
         # Magnitude of the torque. Am = beta(s) * sin(2pi*t/T + 2pi*s/lambda + phi)
         # There is an inconsistency with paper and Elastica cpp implementation. In paper sign in
         # front of wave number is positive, in Elastica cpp it is negative.
-        torque_mag = (
-            factor
-            * self.my_spline(s)
-            * np.sin(
-                self.angular_frequency * time - self.wave_number * s + self.phase_shift
-            )
+        torque_mag = self.torque_mag
+        np.sin(
+            self.angular_frequency * time - self.wave_number_times_s + self.phase_shift,
+            out=torque_mag,
         )
-        # Head and tail of the snake is opposite compared to elastica cpp. We need to iterate torque_mag
-        # from last to first element.
-        torque = np.einsum("j,ij->ij", torque_mag[::-1], self.direction)
-        # TODO: Find a way without doing tow batch_matvec product
-        system.external_torques[..., 1:] += _batch_matvec(
-            system.director_collection, torque
-        )[..., 1:]
-        system.external_torques[..., :-1] -= _batch_matvec(
-            system.director_collection[..., :-1], torque[..., 1:]
+        torque_mag *= self.spline_values
+        torque_mag *= factor
+        _accumulate_muscle_torques(
+            system.director_collection,
+            torque_mag,
+            self.direction,
+            system.external_torques,
         )
+
+
+@numba.njit(cache=True)
+def _accumulate_muscle_torques(
+    director_collection, torque_mag, direction, external_torques
+):
+    """
+    Rotates the muscle torque into each element's material frame and
+    accumulates the equal-and-opposite contributions onto neighboring
+    elements, all in place.
+
+    Parameters
+    ----------
+    director_collection: numpy.ndarray
+        3D (dim, dim, blocksize) array containing data with 'float' type.
+    torque_mag: numpy.ndarray
+        1D (blocksize) array containing data with 'float' type. Torque magnitudes
+        along the arc length.
+    direction: numpy.ndarray
+        2D (dim, 1) array containing data with 'float' type. Muscle torque direction.
+    external_torques: numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type.
+
+    Developer Note
+    --------------
+    Replaces one einsum plus two _batch_matvec products, each of which
+    allocated a (dim, blocksize) temporary per call. Head and tail of
+    the snake is opposite compared to elastica cpp, hence torque_mag is
+    traversed from last to first element.
+    """
+    blocksize = torque_mag.shape[0]
+
+    # Lab-frame torque on element k is torque_mag[blocksize - 1 - k] * direction,
+    # each element feels its own torque ...
+    for k in range(1, blocksize):
+        mag = torque_mag[blocksize - 1 - k]
+        for i in range(3):
+            external_torques[i, k] += mag * (
+                director_collection[i, 0, k] * direction[0, 0]
+                + director_collection[i, 1, k] * direction[1, 0]
+                + director_collection[i, 2, k] * direction[2, 0]
+            )
+
+    # ... and reacts to the torque of its neighbor towards the tail
+    for k in range(blocksize - 1):
+        mag = torque_mag[blocksize - 2 - k]
+        for i in range(3):
+            external_torques[i, k] -= mag * (
+                director_collection[i, 0, k] * direction[0, 0]
+                + director_collection[i, 1, k] * direction[1, 0]
+                + director_collection[i, 2, k] * direction[2, 0]
+            )
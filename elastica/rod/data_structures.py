@@ -1,10 +1,86 @@
 __doc__ = "Data structure wrapper for rod components"
 
+import numba
 import numpy as np
 
 from elastica._rotations import _get_rotation_matrix, _rotate
 
 
+@numba.njit(cache=True)
+def _update_kinematic_states(
+    position_collection, director_collection, scaled_deriv_array, n_nodes
+):
+    """
+    Fused update of the kinematic states (x, Q) from scaled rates dt * (v, ω).
+
+    Positions are incremented and directors are rotated (Rodrigues' formula,
+    see `_get_rotation_matrix`) in a single pass, so that each state array is
+    streamed through cache exactly once per kinematic substep.
+
+    Parameters
+    ----------
+    position_collection: numpy.ndarray
+        2D (dim, n_nodes) array containing data with 'float' type.
+    director_collection: numpy.ndarray
+        3D (dim, dim, n_elems) array containing data with 'float' type.
+    scaled_deriv_array: numpy.ndarray
+        2D (dim, n_nodes + n_elems) array containing dt * (v, ω).
+    n_nodes: int
+        Number of rod nodes, marks where (v, ω) are split in the rate array.
+
+    Returns
+    -------
+
+    """
+    """
+    Developer Note
+    -----
+    The equivalent numpy path (`_get_rotation_matrix` + einsum with a director
+    copy) materializes the skew matrices, their squares, the rotation matrices
+    and a full director copy per call. This kernel performs the same update
+    with no intermediate allocations, which matters as it sits in the
+    innermost loop of the symplectic steppers.
+    """
+    for i in range(position_collection.shape[0]):
+        for k in range(n_nodes):
+            position_collection[i, k] += scaled_deriv_array[i, k]
+
+    # Rotate directors about dt * ω, one element at a time
+    for k in range(director_collection.shape[2]):
+        v0 = scaled_deriv_array[0, n_nodes + k]
+        v1 = scaled_deriv_array[1, n_nodes + k]
+        v2 = scaled_deriv_array[2, n_nodes + k]
+
+        theta = np.sqrt(v0 * v0 + v1 * v1 + v2 * v2)
+        # Tolerance matches the normalization in `_get_rotation_matrix`
+        u0 = v0 / (theta + 1e-14)
+        u1 = v1 / (theta + 1e-14)
+        u2 = v2 / (theta + 1e-14)
+
+        u_prefix = np.sin(theta)
+        u_sq_prefix = 1.0 - np.cos(theta)
+
+        # rot = I - sin(θ) U + (1 - cos(θ)) U², with U = skew(u)
+        rot00 = 1.0 - u_sq_prefix * (u1 * u1 + u2 * u2)
+        rot01 = u_prefix * u2 + u_sq_prefix * u0 * u1
+        rot02 = -u_prefix * u1 + u_sq_prefix * u0 * u2
+        rot10 = -u_prefix * u2 + u_sq_prefix * u0 * u1
+        rot11 = 1.0 - u_sq_prefix * (u0 * u0 + u2 * u2)
+        rot12 = u_prefix * u0 + u_sq_prefix * u1 * u2
+        rot20 = u_prefix * u1 + u_sq_prefix * u0 * u2
+        rot21 = -u_prefix * u0 + u_sq_prefix * u1 * u2
+        rot22 = 1.0 - u_sq_prefix * (u0 * u0 + u1 * u1)
+
+        # Q ← rot @ Q, inlined so no director copy is needed
+        for j in range(3):
+            d0 = director_collection[0, j, k]
+            d1 = director_collection[1, j, k]
+            d2 = director_collection[2, j, k]
+            director_collection[0, j, k] = rot00 * d0 + rot01 * d1 + rot02 * d2
+            director_collection[1, j, k] = rot10 * d0 + rot11 * d1 + rot12 * d2
+            director_collection[2, j, k] = rot20 * d0 + rot21 * d1 + rot22 * d2
+
+
 # FIXME : Explicit Stepper doesn't work as States lose the
 # views they initially had when working with a timestepper.
 class _RodExplicitStepperMixin:
@@ -101,6 +177,18 @@ class _RodSymplecticStepperMixin:
         # dynamic rates needs to call update_accelerations and henc
         # is another function
         self.kinematic_rates = self.dynamic_states.kinematic_rates
+        # Bound once here, so `dynamic_rates` below skips the attribute
+        # chase through dynamic_states on every substep
+        self._dynamic_rates = self.dynamic_states.dynamic_rates
+
+        # When the system provides the internal force/torque computation,
+        # expose it directly and drop one wrapper frame per substep. The
+        # method below remains as the interface for systems that do not
+        # (e.g. the analytical test systems)
+        if hasattr(self, "_compute_internal_forces_and_torques"):
+            self.update_internal_forces_and_torques = (
+                self._compute_internal_forces_and_torques
+            )
 
     """
     The following commented block of code is a test to ensure that
@@ -177,7 +265,7 @@ class _RodSymplecticStepperMixin:
         # shmem(self.acceleration_collection)
         # shmem(self.omega_collection)
         # shmem(self.alpha_collection)
-        return self.dynamic_states.dynamic_rates(time, *args, **kwargs)
+        return self._dynamic_rates(time, *args, **kwargs)
 
 
 def _bootstrap_from_data(stepper_type: str, n_elems: int, vector_states, matrix_states):
@@ -582,16 +670,13 @@ class _KinematicState:
         This is done for efficiency reasons, see _DynamicState's `kinematic_rates`
         method
         """
-        # x += v*dt
-        self.position_collection += scaled_deriv_array[..., : self.n_nodes]
-        # TODO Avoid code repeat
+        # x += v*dt and Q ← rot(ω*dt) Q fused in one numba kernel
         # Devs : see `_State.__iadd__` for reasons why we do matmul here
-        # print(_get_rotation_matrix(1.0, scaled_deriv_array[..., self.n_nodes:]))
-        np.einsum(
-            "ijk,jlk->ilk",
-            _get_rotation_matrix(1.0, scaled_deriv_array[..., self.n_nodes :]),
-            self.director_collection.copy(),
-            out=self.director_collection,
+        _update_kinematic_states(
+            self.position_collection,
+            self.director_collection,
+            scaled_deriv_array,
+            self.n_nodes,
         )
         return self
 
@@ -625,6 +710,16 @@ class _DynamicState:
         # Limit at which (v, w) end
         self.n_kinematic_rates = 2 * n_elems + 1
         self.rate_collection = rate_collection_view
+        # Scratch buffers owned by the state into which the prefac-scaled
+        # rates are written, see `kinematic_rates` and `dynamic_rates`.
+        # Without these every symplectic substep allocates a fresh array
+        # for the `prefac * rates` product
+        self._scaled_kinematic_rates = np.zeros_like(
+            rate_collection_view[..., : self.n_kinematic_rates]
+        )
+        self._scaled_dynamic_rates = np.zeros_like(
+            rate_collection_view[..., self.n_kinematic_rates :]
+        )
 
     def __iadd__(self, scaled_second_deriv_array):
         """ overloaded += operator, updating dynamic_rates
@@ -648,34 +743,46 @@ class _DynamicState:
         self.rate_collection[..., : self.n_kinematic_rates] += scaled_second_deriv_array
         return self
 
-    def kinematic_rates(self, time, *args, **kwargs):
-        """ Yields kinematic rates to interact with _KinematicState
+    def kinematic_rates(self, time, prefac=1.0, *args, **kwargs):
+        """ Yields prefac-scaled kinematic rates to interact with _KinematicState
 
         Returns
         -------
-        v_and_omega : numpy.ndarray consisting of (v,ω)
+        v_and_omega : numpy.ndarray consisting of prefac * (v,ω)
 
         Caveats
         -------
         Doesn't return a _KinematicState with (dt*v, dt*w) as members,
         as one expects the _Kinematic __add__ operator to interact
         with another _KinematicState. This is done for efficiency purposes.
+        The scaling by prefac happens here, into a scratch buffer owned by
+        this state, so that the stepper performs no per-substep allocation.
         """
-        # RHS functino call, gives v,w so that
+        # RHS functino call, gives prefac * (v,w) so that
         # Comes from kin_state -> (x,Q) += dt * (v,w) <- First part of dyn_state
-        return self.rate_collection[..., : self.n_kinematic_rates]
+        return np.multiply(
+            prefac,
+            self.rate_collection[..., : self.n_kinematic_rates],
+            out=self._scaled_kinematic_rates,
+        )
 
-    def dynamic_rates(self, time, *args, **kwargs):
-        """ Yields dynamic rates to add to with _DynamicState
+    def dynamic_rates(self, time, prefac=1.0, *args, **kwargs):
+        """ Yields prefac-scaled dynamic rates to add to with _DynamicState
 
         Returns
         -------
-        acc_and_alpha : numpy.ndarray consisting of (dv/dt,dω/dt)
+        acc_and_alpha : numpy.ndarray consisting of prefac * (dv/dt,dω/dt)
 
         Note
         -------
         Doesn't return a _DynamicState with (dt*v, dt*w) as members,
         as one expects the _Dynamic __add__ operator to interact
         with another _DynamicState. This is done for efficiency purposes.
+        The scaling by prefac happens here, into a scratch buffer owned by
+        this state, so that the stepper performs no per-substep allocation.
         """
-        return self.rate_collection[..., self.n_kinematic_rates :]
+        return np.multiply(
+            prefac,
+            self.rate_collection[..., self.n_kinematic_rates :],
+            out=self._scaled_dynamic_rates,
+        )
@@ -22,8 +22,10 @@ class BaseSymplecticSystem:
     def __init__(self):
         pass
 
-    def kinematic_rates(self, *args):
-        return self._dyn_state
+    def kinematic_rates(self, time, prefac, *args):
+        # Rates are handed back already scaled by prefac, mirroring the
+        # symplectic stepper protocol of the rod data-structures
+        return prefac * self._dyn_state
 
     @property
     def kinematic_states(self):
@@ -112,10 +114,13 @@ class SymplecticUndampedSimpleHarmonicOscillatorSystem(
         self._kin_state = self._state[0:1]  # Create a view instead
         self._dyn_state = self._state[1:2]  # Create a view instead
 
-    def dynamic_rates(self, *args, **kwargs):
-        return super(SymplecticUndampedSimpleHarmonicOscillatorSystem, self).__call__(
-            *args, **kwargs
-        )[-1]
+    def dynamic_rates(self, time, prefac, *args, **kwargs):
+        return (
+            prefac
+            * super(SymplecticUndampedSimpleHarmonicOscillatorSystem, self).__call__(
+                *args, **kwargs
+            )[-1]
+        )
 
     def compute_energy(self, time):
         # http://scipp.ucsc.edu/~haber/ph5B/sho09.pdf
@@ -252,10 +257,10 @@ class SecondOrderHybridSystem:
         return np.array([x, f, v, w])
 
     def kinematic_rates(self, time, prefac):
-        return self.dynamic_states[0]  # dx/dt = v
+        return prefac * self.dynamic_states[0]  # dx/dt = v
 
     def dynamic_rates(self, time, prefac):
-        return -self.dynamic_states ** 2  # d(v,w)/dt = -(v,w)**2
+        return -prefac * self.dynamic_states ** 2  # d(v,w)/dt = -(v,w)**2
 
     def final_solution(self, time):
         if np.allclose(self.linearly_evolving_state[0, 0, 0], self.initial_value[1]):
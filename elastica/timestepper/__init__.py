@@ -43,7 +43,24 @@ def extend_stepper_interface(Stepper, System):
         if is_this_system_a_collection
         else _SystemInstanceStepperMixin
     )
-    extend_instance(ConcreteStepper, ExtendClass)
+    # Extension is cached : if this stepper was already extended for this
+    # kind of system, reuse it. Otherwise repeated `integrate` calls keep
+    # stacking dynamically generated classes onto the stepper's MRO.
+    if ExtendClass not in ConcreteStepper.__class__.__bases__:
+        extend_instance(ConcreteStepper, ExtendClass)
+
+    # For symplectic steppers driving a system collection, the stage count
+    # is fixed : replace the generic staged loop with a specialized,
+    # unrolled version generated once per stepper instance. The
+    # specialization lives in the instance __dict__, so when the same
+    # stepper is later re-extended for a bare system it must be dropped
+    # again, lest it shadow the instance mixin's class-level do_step
+    if SymplecticStepper in ConcreteStepper.__class__.mro():
+        if is_this_system_a_collection:
+            if "do_step" not in ConcreteStepper.__dict__:
+                ConcreteStepper.do_step = ConcreteStepper._make_specialized_do_step()
+        else:
+            ConcreteStepper.__dict__.pop("do_step", None)
 
 
 # TODO Improve interface of this function to take args and kwargs for ease of use
@@ -60,10 +77,35 @@ def integrate(StatefulStepper, System, final_time: float, n_steps: int = 1000):
     dt = np.float64(float(final_time) / n_steps)
     time = np.float64(0.0)
 
+    # Anchor the stepper's callback step counter to this run's start time :
+    # a stepper reused across integrate calls with an unchanged dt would
+    # otherwise keep counting from where the previous run stopped
+    ConcreteStepper = (
+        StatefulStepper.stepper
+        if _StatefulStepper in StatefulStepper.__class__.mro()
+        else StatefulStepper
+    )
+    if hasattr(ConcreteStepper, "_step_index"):
+        ConcreteStepper._step_index = int(round(time / dt))
+
     from tqdm import tqdm
 
-    for i in tqdm(range(n_steps)):
-        time = StatefulStepper.do_step(System, time, dt)
+    # Bind the concrete do_step once : every iteration below is then one
+    # call with no attribute lookup on the stepper in between
+    do_step = StatefulStepper.do_step
+
+    # Tick the progress bar once per chunk of steps rather than per step :
+    # for small systems the per-iteration bookkeeping of the bar is
+    # comparable to the cost of a substep, and the inner loop below runs
+    # back-to-back do_step calls with nothing in between
+    chunk_size = min(100, n_steps)
+    n_chunks, n_remainder_steps = divmod(n_steps, chunk_size)
+
+    for _ in tqdm(range(n_chunks)):
+        for _ in range(chunk_size):
+            time = do_step(System, time, dt)
+    for _ in range(n_remainder_steps):
+        time = do_step(System, time, dt)
 
     print("Final time of simulation is : ", time)
     return
@@ -17,23 +17,22 @@ is referred to the same section on `explicit_steppers.py`.
 
 class _SystemInstanceStepperMixin:
     def do_step(self, System, time: np.float64, dt: np.float64):
-        for (
-            kin_prefactor,
-            kin_step,
-            dyn_prefactor,
-            dyn_step,
-        ) in self._steps_and_prefactors[:-1]:
-            prefac = kin_prefactor(self, dt)
-            time = kin_step(self, System, time, prefac)
-            prefac = dyn_prefactor(self, dt)
-            time = dyn_step(self, System, time, prefac)
+        # Iterate the kinematic/dynamic sequences side-by-side rather than
+        # unpacking (prefactor, step) tuples in the hot loop. Prefactors are
+        # resolved to plain floats once per dt, not once per substep
+        if dt != self._cached_dt:
+            self._build_prefactor_values(dt)
+        kin_prefactor_values = self._kinematic_prefactor_values
+        kin_steps = self._kinematic_steps
+        dyn_prefactor_values = self._dynamic_prefactor_values
+        dyn_steps = self._dynamic_steps
+
+        for idx in range(len(dyn_steps)):
+            time = kin_steps[idx](self, System, time, kin_prefactor_values[idx])
+            time = dyn_steps[idx](self, System, time, dyn_prefactor_values[idx])
 
         # Peel the last kinematic step and prefactor alone
-        last_kin_prefactor = self._steps_and_prefactors[-1][0]
-        last_kin_step = self._steps_and_prefactors[-1][1]
-
-        prefac = last_kin_prefactor(self, dt)
-        time = last_kin_step(self, System, time, prefac)
+        time = kin_steps[-1](self, System, time, kin_prefactor_values[-1])
         return time
 
 
@@ -56,52 +55,146 @@ class _SystemCollectionStepperMixin:
         -------
 
         """
-        for (
-            kin_prefactor,
-            kin_step,
-            dyn_prefactor,
-            dyn_step,
-        ) in self._steps_and_prefactors[:-1]:
-            prefac = kin_prefactor(self, dt)
-            for system in SystemCollection[:-1]:
+        # Iterate the kinematic/dynamic sequences side-by-side rather than
+        # unpacking (prefactor, step) tuples in the hot loop. Prefactors are
+        # resolved to plain floats once per dt, not once per substep
+        if dt != self._cached_dt:
+            self._build_prefactor_values(dt)
+            # (Re)anchor the integer step counter to the current time : the
+            # callback at the end then gets a maintained integer instead of
+            # a float division per step (which can also round wrongly late
+            # into long runs)
+            self._step_index = int(round(time / dt))
+        kin_prefactor_values = self._kinematic_prefactor_values
+        kin_steps = self._kinematic_steps
+        dyn_prefactor_values = self._dynamic_prefactor_values
+        dyn_steps = self._dynamic_steps
+        # TODO: remove below line and try to find a better call option to compute internal forces and torques
+        # We need internal forces and torques because they are used by interaction module.
+        update_internal_forces_torques = self._update_internal_forces_torques[
+            0
+        ]  # here 0 because you have one item in list
+
+        # Hoisted once per step : the systems do not change within a step, so
+        # there is no reason to re-slice the collection on every substep. For
+        # the (common) single-system collection, `rest_systems` is empty and
+        # all the inner loops below degenerate into direct calls on one system.
+        rest_systems = SystemCollection[:-1]
+        last_system = SystemCollection[-1]
+
+        for idx in range(len(dyn_steps)):
+            kin_step = kin_steps[idx]
+            prefac = kin_prefactor_values[idx]
+            for system in rest_systems:
                 _ = kin_step(self, system, time, prefac)
-            time = kin_step(self, SystemCollection[-1], time, prefac)
-
-            # TODO: remove below lines and try to find a better call option to compute internal forces and torques
-            # We need internal forces and torques because they are used by interaction module.
-            update_internal_forces_torques = self._update_internal_forces_torques[
-                0
-            ]  # here 0 because you have one item in list
-            for system in SystemCollection[:-1]:
+            time = kin_step(self, last_system, time, prefac)
+
+            for system in rest_systems:
                 _ = update_internal_forces_torques(self, system, time)
-            time = update_internal_forces_torques(self, SystemCollection[-1], time)
+            time = update_internal_forces_torques(self, last_system, time)
 
             # BoCos, External forces, controls etc.
             SystemCollection.synchronize(time)
             # TODO: remove below line, it should be some other function synchronizeBC
             SystemCollection.synchronizeBC(time)
-            prefac = dyn_prefactor(self, dt)
-            for system in SystemCollection[:-1]:
+            dyn_step = dyn_steps[idx]
+            prefac = dyn_prefactor_values[idx]
+            for system in rest_systems:
                 _ = dyn_step(self, system, time, prefac)
-            time = dyn_step(self, SystemCollection[-1], time, prefac)
+            time = dyn_step(self, last_system, time, prefac)
 
             # TODO: remove below line, it should be some other function synchronizeBC
             SystemCollection.synchronizeBC(time)
 
         # Peel the last kinematic step and prefactor alone
-        last_kin_prefactor = self._steps_and_prefactors[-1][0]
-        last_kin_step = self._steps_and_prefactors[-1][1]
+        last_kin_step = kin_steps[-1]
 
-        prefac = last_kin_prefactor(self, dt)
-        for system in SystemCollection[:-1]:
+        prefac = kin_prefactor_values[-1]
+        for system in rest_systems:
             _ = last_kin_step(self, system, time, prefac)
-        time = last_kin_step(self, SystemCollection[-1], time, prefac)
+        time = last_kin_step(self, last_system, time, prefac)
 
         # Call back function, will call the user defined call back functions and store data
-        SystemCollection.callBack(time, int(time / dt))
+        self._step_index += 1
+        SystemCollection.callBack(time, self._step_index)
 
         return time
 
+    def _make_specialized_do_step(self):
+        """
+        Generates a `do_step` with the stage loop above unrolled into
+        straight-line calls, and binds the stage methods into the local
+        namespace so that no tuple indexing remains per substep.
+
+        The number of stages is fixed once the stepper is constructed
+        (two for PositionVerlet, five for PEFRL), so the generic
+        `for idx in range(...)` dispatch can be specialized away, in the
+        same spirit as `BaseSystemCollection._make_specialized_synchronize`.
+
+        Returns
+        -------
+        function with the same signature as `do_step`, minus `self`
+
+        """
+        # Mock steppers used in the tests carry no steps : nothing to
+        # unroll, keep the generic version
+        if not self._kinematic_steps:
+            return self.do_step
+
+        namespace = {"_stepper": self}
+        for idx, step in enumerate(self._kinematic_steps):
+            namespace["_kin_step_{0}".format(idx)] = step
+        for idx, step in enumerate(self._dynamic_steps):
+            namespace["_dyn_step_{0}".format(idx)] = step
+        namespace["_update_forces_torques"] = self._update_internal_forces_torques[0]
+
+        lines = [
+            "def _do_step(SystemCollection, time, dt):",
+            "    if dt != _stepper._cached_dt:",
+            "        _stepper._build_prefactor_values(dt)",
+            "        _stepper._step_index = int(round(time / dt))",
+            "    kin_prefactor_values = _stepper._kinematic_prefactor_values",
+            "    dyn_prefactor_values = _stepper._dynamic_prefactor_values",
+            "    rest_systems = SystemCollection[:-1]",
+            "    last_system = SystemCollection[-1]",
+        ]
+
+        def emit_over_systems(call_template):
+            lines.append(
+                "    for system in rest_systems:\n        _ = "
+                + call_template.format("system")
+            )
+            lines.append("    time = " + call_template.format("last_system"))
+
+        for idx in range(len(self._dynamic_steps)):
+            emit_over_systems(
+                "_kin_step_{0}(_stepper, {{0}}, time, kin_prefactor_values[{0}])".format(
+                    idx
+                )
+            )
+            emit_over_systems("_update_forces_torques(_stepper, {0}, time)")
+            lines.append("    SystemCollection.synchronize(time)")
+            lines.append("    SystemCollection.synchronizeBC(time)")
+            emit_over_systems(
+                "_dyn_step_{0}(_stepper, {{0}}, time, dyn_prefactor_values[{0}])".format(
+                    idx
+                )
+            )
+            lines.append("    SystemCollection.synchronizeBC(time)")
+
+        # Peeled last kinematic step, exactly as in the generic version
+        emit_over_systems(
+            "_kin_step_{0}(_stepper, {{0}}, time, kin_prefactor_values[{0}])".format(
+                len(self._kinematic_steps) - 1
+            )
+        )
+        lines.append("    _stepper._step_index += 1")
+        lines.append("    SystemCollection.callBack(time, _stepper._step_index)")
+        lines.append("    return time")
+
+        exec(compile("\n".join(lines), "<do_step>", "exec"), namespace)
+        return namespace["_do_step"]
+
 
 class SymplecticStepper(_TimeStepper):
     """
@@ -168,10 +261,12 @@ class SymplecticStepper(_TimeStepper):
             self._prefactors
         ), "Size mismatch in the number of steps and prefactors provided for a Symplectic Stepper!"
 
-        self._kinematic_steps = self._steps[::2]
-        self._dynamic_steps = self._steps[1::2]
-        self._kinematic_prefactors = self._prefactors[::2]
-        self._dynamic_prefactors = self._prefactors[1::2]
+        # Store as parallel tuples (structure-of-arrays) : `do_step` indexes
+        # into these directly instead of unpacking tuple-of-tuples entries
+        self._kinematic_steps = tuple(self._steps[::2])
+        self._dynamic_steps = tuple(self._steps[1::2])
+        self._kinematic_prefactors = tuple(self._prefactors[::2])
+        self._dynamic_prefactors = tuple(self._prefactors[1::2])
 
         # Avoid this check for MockClasses
         if len(self._kinematic_steps) > 0:
@@ -182,20 +277,44 @@ class SymplecticStepper(_TimeStepper):
                 len(self._kinematic_prefactors) == len(self._dynamic_prefactors) + 1
             ), "Size mismatch in the number of kinematic and dynamic prefactors provided for a Symplectic Stepper!"
 
-        from itertools import zip_longest
+        # dt-resolved prefactor values, computed lazily on the first step and
+        # only recomputed when dt changes (see `_build_prefactor_values`)
+        self._cached_dt = None
+        self._kinematic_prefactor_values = None
+        self._dynamic_prefactor_values = None
+        # Integer step counter maintained across `do_step` calls, anchored
+        # whenever dt changes : feeds the callback's current_step
+        self._step_index = 0
 
-        self._steps_and_prefactors = tuple(
-            zip_longest(
-                self._kinematic_prefactors,
-                self._kinematic_steps,
-                self._dynamic_prefactors,
-                self._dynamic_steps,
-            )
+    def _build_prefactor_values(self, dt):
+        """ Resolves all prefactors into plain floats for a given dt
+
+        The prefactors are constant throughout an integration (dt does not
+        change), so there is no reason to re-dispatch into the prefactor
+        methods on every substep of every timestep.
+
+        Parameters
+        ----------
+        dt : the time step of simulation
+
+        Returns
+        -------
+
+        """
+        self._kinematic_prefactor_values = tuple(
+            prefactor(self, dt) for prefactor in self._kinematic_prefactors
+        )
+        self._dynamic_prefactor_values = tuple(
+            prefactor(self, dt) for prefactor in self._dynamic_prefactors
         )
+        self._cached_dt = dt
 
     @property
     def n_stages(self):
-        return len(self._steps_and_prefactors)
+        # One stage per kinematic step : the trailing kinematic step has no
+        # dynamic partner (it is peeled off separately in `do_step`), so no
+        # sentinel padding of the dynamic sequences is needed
+        return len(self._kinematic_steps)
 
 
 class PositionVerlet(SymplecticStepper):
@@ -211,14 +330,16 @@ class PositionVerlet(SymplecticStepper):
         return 0.5 * dt
 
     def _first_kinematic_step(self, System, time: np.float64, prefac: np.float64):
-        System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
+        # The system scales its rates by prefac internally (into a scratch
+        # buffer it owns), so no temporary is allocated on this side
+        System.kinematic_states += System.kinematic_rates(time, prefac)
         return time + prefac
 
     def _first_dynamic_prefactor(self, dt):
         return dt
 
     def _first_dynamic_step(self, System, time: np.float64, prefac: np.float64):
-        System.dynamic_states += prefac * System.dynamic_rates(
+        System.dynamic_states += System.dynamic_rates(
             time, prefac
         )  # TODO : Why should we pass dt into System again?
         return time
@@ -258,28 +379,28 @@ class PEFRL(SymplecticStepper):
         return self.ξ * dt
 
     def _first_kinematic_step(self, System, time: np.float64, prefac: np.float64):
-        System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
+        System.kinematic_states += System.kinematic_rates(time, prefac)
         return time + prefac
 
     def _first_dynamic_prefactor(self, dt):
         return self.lambda_dash_coeff * dt
 
     def _first_dynamic_step(self, System, time: np.float64, prefac: np.float64):
-        System.dynamic_states += prefac * System.dynamic_rates(time, prefac)
+        System.dynamic_states += System.dynamic_rates(time, prefac)
         return time
 
     def _second_kinematic_prefactor(self, dt):
         return self.χ * dt
 
     def _second_kinematic_step(self, System, time: np.float64, prefac: np.float64):
-        System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
+        System.kinematic_states += System.kinematic_rates(time, prefac)
         return time + prefac
 
     def _second_dynamic_prefactor(self, dt):
         return self.λ * dt
 
     def _second_dynamic_step(self, System, time: np.float64, prefac: np.float64):
-        System.dynamic_states += prefac * System.dynamic_rates(time, prefac)
+        System.dynamic_states += System.dynamic_rates(time, prefac)
         return time
 
     def _third_kinematic_prefactor(self, dt):
@@ -287,7 +408,7 @@ class PEFRL(SymplecticStepper):
 
     def _third_kinematic_step(self, System, time: np.float64, prefac: np.float64):
         # Need to fill in
-        System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
+        System.kinematic_states += System.kinematic_rates(time, prefac)
         return time + prefac
 
     # TODO: find a better place for this or a better call option. We need to compute internal forces and torques before external because interaction uses it!
@@ -45,10 +45,19 @@ class BaseSystemCollection(MutableSequence):
         self.allowed_sys_types = (RodBase,)
         # List of systems to be integrated
         self._systems = []
+        # id()-keyed lookup table for system indices, kept in sync with
+        # `_systems` through the MutableSequence hooks below. Avoids O(N)
+        # `list.index` scans (and the elementwise __eq__ they trigger on
+        # numpy-holding systems) in `_get_sys_idx_if_valid`
+        self._sys_id_to_idx = {}
         # List of feature calls, such as those coming
         # from Controllers, Environments which are
         # tacked on to the SystemCollection in a sim.
         self._features = NotImplemented
+        # Set once `finalize` runs : every setup-time validation
+        # (_check_type, index lookups) is gated behind it, so none of it
+        # can leak into the stepping hot path
+        self._finalize_flag = False
 
     def _check_type(self, sys_to_be_added):
         if not issubclass(sys_to_be_added.__class__, self.allowed_sys_types):
@@ -72,14 +81,25 @@ class BaseSystemCollection(MutableSequence):
 
     def __delitem__(self, idx):
         del self._systems[idx]
+        self._rebuild_sys_idx_map()
 
     def __setitem__(self, idx, system):
         self._check_type(system)
         self._systems[idx] = system
+        self._rebuild_sys_idx_map()
 
     def insert(self, idx, system):
+        assert not self._finalize_flag, "Cannot add systems after finalize is called"
         self._check_type(system)
         self._systems.insert(idx, system)
+        self._rebuild_sys_idx_map()
+
+    def _rebuild_sys_idx_map(self):
+        # Mutations happen only during setup, so a full rebuild is cheap and
+        # keeps indices correct for insertions/deletions in the middle
+        self._sys_id_to_idx = {
+            id(system): idx for idx, system in enumerate(self._systems)
+        }
 
     def __str__(self):
         return str(self._systems)
@@ -93,6 +113,12 @@ class BaseSystemCollection(MutableSequence):
     def _get_sys_idx_if_valid(self, sys_to_be_added):
         from numpy import int_ as npint
 
+        # Setup-time only : anything registered after finalize would miss
+        # the resolved references the wrappers build there
+        assert (
+            not self._finalize_flag
+        ), "Cannot query or register systems after finalize is called"
+
         n_systems = len(self._systems)  # Total number of systems from mixed-in class
 
         if isinstance(sys_to_be_added, (int, npint)):
@@ -105,10 +131,12 @@ class BaseSystemCollection(MutableSequence):
             sys_idx = sys_to_be_added
         elif self._check_type(sys_to_be_added):
             # 2. If they are rod objects (most likely), lookup indices
-            # index might have some problems : https://stackoverflow.com/a/176921
+            # O(1) by identity : `list.index` compares with ==, which for
+            # numpy-holding systems does elementwise comparisons and can
+            # even raise (https://stackoverflow.com/a/176921)
             try:
-                sys_idx = self._systems.index(sys_to_be_added)
-            except ValueError:
+                sys_idx = self._sys_id_to_idx[id(sys_to_be_added)]
+            except KeyError:
                 raise ValueError(
                     "Rod {} was not found, did you append it to the system?".format(
                         sys_to_be_added
@@ -136,17 +164,54 @@ class BaseSystemCollection(MutableSequence):
             ]
             return list(chain.from_iterable(methods))
 
-        self._features = get_methods_from_feature_classes("__call__")
+        # Frozen as tuples : the feature sets never change after finalize and
+        # tuple iteration is cheaper than list iteration in the hot loops
+        self._features = tuple(get_methods_from_feature_classes("__call__"))
         # TODO: we may need to remove featureBC below
-        self._featuresBC = get_methods_from_feature_classes("_callBC")
-        self._featuresCallBack = get_methods_from_feature_classes("_callBack")
+        self._featuresBC = tuple(get_methods_from_feature_classes("_callBC"))
+        self._featuresCallBack = tuple(get_methods_from_feature_classes("_callBack"))
         finalize_methods = get_methods_from_feature_classes("_finalize")
 
         for finalize in finalize_methods:
             finalize(self)
 
+        # The feature list is frozen from here on : specialize `synchronize`
+        # into straight-line calls (no loop setup, no iterator per substep)
+        self.synchronize = self._make_specialized_synchronize()
+
+        # Reject further mutation/registration, see `insert` and
+        # `_get_sys_idx_if_valid`
+        self._finalize_flag = True
+
+    def _make_specialized_synchronize(self):
+        """
+        Generates a `synchronize` function with one direct call per
+        registered feature, unrolled at finalize time.
+
+        As `synchronize` runs on every substep of every timestep, the
+        generic loop over `self._features` costs an iterator setup and a
+        list lookup per feature per call. Since the features are known and
+        frozen once `finalize` is called, we emit the call sequence as
+        straight-line source instead and bind it on the instance.
+
+        Returns
+        -------
+        function taking `time`, calling every feature in order
+
+        """
+        namespace = {"_system_collection": self}
+        lines = ["def _synchronize(time):"]
+        for idx, feature in enumerate(self._features):
+            namespace["_feature_{0}".format(idx)] = feature
+            lines.append("    _feature_{0}(_system_collection, time)".format(idx))
+        if not self._features:
+            lines.append("    pass")
+        exec(compile("\n".join(lines), "<synchronize>", "exec"), namespace)
+        return namespace["_synchronize"]
+
     def synchronize(self, time):
         # Calls all constraints, connections, controls etc.
+        # (generic path, replaced by the specialized version in `finalize`)
         for feature in self._features:
             feature(self, time)
 
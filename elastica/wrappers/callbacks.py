@@ -67,10 +67,16 @@ class CallBacks:
         # to sort callbacks.
         self._callbacks.sort(key=lambda x: x[0])
 
+        # Frozen hereafter, so freeze into a tuple for cheaper iteration
+        self._callbacks = tuple(self._callbacks)
+
         self._callBack(time=0.0, current_step=0)
 
     # TODO: same as above naming of _callBack function
     def _callBack(self, time, current_step: int, *args, **kwargs):
+        # Fast bypass : nothing registered, nothing to record
+        if not self._callbacks:
+            return
         for sys_id, callback in self._callbacks:
             callback.make_callback(
                 self._systems[sys_id], time, current_step, *args, **kwargs
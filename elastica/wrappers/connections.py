@@ -23,6 +23,8 @@ class Connections:
 
     def __init__(self):
         self._connections = []
+        # System-resolved counterpart of _connections, built in _finalize
+        self._resolved_connections = ()
         super(Connections, self).__init__()
 
     def connect(
@@ -76,29 +78,51 @@ class Connections:
             (*connection.id(), connection()) for connection in self._connections
         ]
 
+        # Frozen hereafter, so freeze into a tuple for cheaper iteration in
+        # the substep-hot `__call__`
+        self._connections = tuple(self._connections)
+
+        # Resolve the system indices into system references once : `__call__`
+        # then needs no `self._systems[idx]` lookup (two per connection per
+        # substep otherwise). The index form above is kept as the
+        # user-inspectable record of the connections.
+        self._resolved_connections = tuple(
+            (
+                self._systems[first_sys_idx],
+                first_connect_idx,
+                self._systems[second_sys_idx],
+                second_connect_idx,
+                connection,
+            )
+            for (
+                first_sys_idx,
+                second_sys_idx,
+                first_connect_idx,
+                second_connect_idx,
+                connection,
+            ) in self._connections
+        )
+
         # Need to finally solve CPP here, if we are doing things properly
         # This is to optimize the call tree for better memory accesses
         # https://brooksandrew.github.io/simpleblog/articles/intro-to-graph-optimization-solving-cpp/
 
     def __call__(self, *args, **kwargs):
+        # Fast bypass : no registered connections, skip the loop setup
+        if not self._resolved_connections:
+            return
         for (
-            first_sys_idx,
-            second_sys_idx,
+            first_system,
             first_connect_idx,
+            second_system,
             second_connect_idx,
             connection,
-        ) in self._connections:
+        ) in self._resolved_connections:
             connection.apply_forces(
-                self._systems[first_sys_idx],
-                first_connect_idx,
-                self._systems[second_sys_idx],
-                second_connect_idx,
+                first_system, first_connect_idx, second_system, second_connect_idx
             )
             connection.apply_torques(
-                self._systems[first_sys_idx],
-                first_connect_idx,
-                self._systems[second_sys_idx],
-                second_connect_idx,
+                first_system, first_connect_idx, second_system, second_connect_idx
             )
 
 
@@ -67,6 +67,10 @@ class Constraints:
         # to sort constraints.
         self._constraints.sort(key=lambda x: x[0])
 
+        # Frozen hereafter, so freeze into a tuple for cheaper iteration in
+        # the substep-hot `_callBC`
+        self._constraints = tuple(self._constraints)
+
         # At t=0.0, constrain all the boundary conditions (for compatability with
         # initial conditions)
         # TODO: you may need to change naming of _callBC
@@ -74,6 +78,10 @@ class Constraints:
 
     # TODO: same as above naming of _callBC function
     def _callBC(self, time, *args, **kwargs):
+        # Fast bypass : no registered constraints means no work, skip the
+        # loop setup entirely (this is hit twice per substep)
+        if not self._constraints:
+            return
         for sys_id, constraint in self._constraints:
             constraint.constrain_values(self._systems[sys_id], time, *args, **kwargs)
             constraint.constrain_rates(self._systems[sys_id], time, *args, **kwargs)
@@ -21,6 +21,8 @@ class Forcing:
 
     def __init__(self):
         self._ext_forces_torques = []
+        # Flat (bound method, system) pairs, built in _finalize
+        self._resolved_operations = ()
         super(Forcing, self).__init__()
 
     def add_forcing_to(self, system):
@@ -66,11 +68,34 @@ class Forcing:
         # to sort _ext_forces_torques.
         self._ext_forces_torques.sort(key=lambda x: x[0])
 
-    def __call__(self, time, *args, **kwargs):
+        # Frozen hereafter, so freeze into a tuple for cheaper iteration in
+        # the substep-hot `__call__`
+        self._ext_forces_torques = tuple(self._ext_forces_torques)
+
+        # Flatten into a homogeneous sequence of (bound method, system)
+        # operations : system lookup and attribute dispatch then happen once
+        # here rather than per forcing per substep. Forcing halves inherited
+        # unchanged from NoForces are no-ops and are dropped outright (e.g.
+        # pure torque actuators never pay for an apply_forces call).
+        from elastica.external_forces import NoForces
+
+        operations = []
         for sys_id, ext_force_torque in self._ext_forces_torques:
-            ext_force_torque.apply_forces(self._systems[sys_id], time, *args, **kwargs)
-            ext_force_torque.apply_torques(self._systems[sys_id], time, *args, **kwargs)
-            # TODO Apply torque, see if necessary
+            system = self._systems[sys_id]
+            forcing_cls = type(ext_force_torque)
+            if forcing_cls.apply_forces is not NoForces.apply_forces:
+                operations.append((ext_force_torque.apply_forces, system))
+            if forcing_cls.apply_torques is not NoForces.apply_torques:
+                operations.append((ext_force_torque.apply_torques, system))
+        self._resolved_operations = tuple(operations)
+
+    def __call__(self, time, *args, **kwargs):
+        # Fast bypass : no registered forcing, skip the loop setup (this is
+        # hit on every substep through `synchronize`)
+        if not self._resolved_operations:
+            return
+        for apply_force_or_torque, system in self._resolved_operations:
+            apply_force_or_torque(system, time, *args, **kwargs)
 
 
 class _ExtForceTorque:
@@ -6,7 +6,6 @@ import sys
 sys.path.append("../../")
 
 import os
-from collections import defaultdict
 from elastica.wrappers import BaseSystemCollection, Constraints, Forcing, CallBacks
 from elastica.rod.cosserat_rod import CosseratRod
 from elastica.external_forces import MuscleTorques
@@ -87,47 +86,66 @@ def run_flagella(
     class ContinuumFlagellaCallBack(CallBackBaseClass):
         """
         Call back function for continuum snake
+
+        Snapshots are written into buffers preallocated for the whole run,
+        instead of appending freshly copied arrays to python lists. This
+        keeps the time-loop free of allocations and leaves the recorded
+        data contiguous for post-processing.
         """
 
-        def __init__(self, step_skip: int, callback_params: dict):
+        def __init__(self, step_skip: int, callback_params: dict, n_snapshots: int):
             CallBackBaseClass.__init__(self)
             self.every = step_skip
+            self.n_snapshots = n_snapshots
             self.callback_params = callback_params
+            self._snapshot_idx = 0
 
         def make_callback(self, system, time, current_step: int):
 
-            if current_step % self.every == 0:
-
-                self.callback_params["time"].append(time)
-                self.callback_params["step"].append(current_step)
-                self.callback_params["position"].append(
-                    system.position_collection.copy()
-                )
-                self.callback_params["velocity"].append(
-                    system.velocity_collection.copy()
-                )
-                self.callback_params["avg_velocity"].append(
-                    system.compute_velocity_center_of_mass()
-                )
-                self.callback_params["center_of_mass"].append(
-                    system.compute_position_center_of_mass()
-                )
+            if current_step % self.every == 0 and self._snapshot_idx < self.n_snapshots:
+                idx = self._snapshot_idx
+                params = self.callback_params
+
+                if idx == 0:
+                    # Allocate all snapshot buffers up-front, now that the
+                    # system shape is known
+                    n_nodes = system.position_collection.shape[-1]
+                    params["time"] = np.zeros((self.n_snapshots,))
+                    params["step"] = np.zeros((self.n_snapshots,), dtype=np.int64)
+                    params["position"] = np.zeros((self.n_snapshots, 3, n_nodes))
+                    params["velocity"] = np.zeros((self.n_snapshots, 3, n_nodes))
+                    params["avg_velocity"] = np.zeros((self.n_snapshots, 3))
+                    params["center_of_mass"] = np.zeros((self.n_snapshots, 3))
+
+                params["time"][idx] = time
+                params["step"][idx] = current_step
+                # Slice assignment copies into the preallocated buffers
+                params["position"][idx] = system.position_collection
+                params["velocity"][idx] = system.velocity_collection
+                params["avg_velocity"][idx] = system.compute_velocity_center_of_mass()
+                params["center_of_mass"][idx] = system.compute_position_center_of_mass()
+                self._snapshot_idx += 1
 
                 return
 
-    pp_list = defaultdict(list)
+    final_time = (10.0 + 0.01) * period
+    dt = 2.5e-5 * period
+    total_steps = int(final_time / dt)
+    print("Total steps", total_steps)
+
+    step_skip = 200
+    pp_list = {}
     flagella_sim.collect_diagnostics(shearable_rod).using(
-        ContinuumFlagellaCallBack, step_skip=200, callback_params=pp_list
+        ContinuumFlagellaCallBack,
+        step_skip=step_skip,
+        callback_params=pp_list,
+        n_snapshots=total_steps // step_skip + 1,
     )
 
     flagella_sim.finalize()
     timestepper = PositionVerlet()
     # timestepper = PEFRL()
 
-    final_time = (10.0 + 0.01) * period
-    dt = 2.5e-5 * period
-    total_steps = int(final_time / dt)
-    print("Total steps", total_steps)
     integrate(timestepper, flagella_sim, final_time, total_steps)
 
     if PLOT_FIGURE: